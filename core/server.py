@@ -4,6 +4,7 @@ import os
 from typing import List, Optional
 from importlib import metadata
 
+import anyio
 from fastapi.responses import HTMLResponse, JSONResponse, FileResponse
 from starlette.applications import Starlette
 from starlette.datastructures import MutableHeaders
@@ -480,6 +481,51 @@ async def health_check(request: Request):
     )
 
 
+ZEROCOPY_SEND_EXTENSION = "http.response.zerocopysend"
+
+
+class ZeroCopyFileResponse(FileResponse):
+    """FileResponse that hands the open file to the ASGI server.
+
+    When the server advertises the ``http.response.zerocopysend`` extension a
+    plain (non-HEAD, non-range) body is sent with ``sendfile(2)`` instead of
+    being read through Python in chunks. Everything else, including stat
+    checks, range handling and websocket denial, is the stock FileResponse.
+    """
+
+    _zerocopy_send = False
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        extensions = scope.get("extensions", {})
+        self._zerocopy_send = (
+            scope["type"] == "http" and ZEROCOPY_SEND_EXTENSION in extensions
+        )
+        await super().__call__(scope, receive, send)
+
+    async def _handle_simple(
+        self, send: Send, send_header_only: bool, send_pathsend: bool
+    ) -> None:
+        if not self._zerocopy_send or send_header_only or send_pathsend:
+            await super()._handle_simple(send, send_header_only, send_pathsend)
+            return
+
+        await send(
+            {
+                "type": "http.response.start",
+                "status": self.status_code,
+                "headers": self.raw_headers,
+            }
+        )
+        async with await anyio.open_file(self.path, mode="rb") as file:
+            await send(
+                {
+                    "type": ZEROCOPY_SEND_EXTENSION,
+                    "file": file.wrapped,
+                    "more_body": False,
+                }
+            )
+
+
 @server.custom_route("/attachments/{file_id}", methods=["GET"])
 async def serve_attachment(request: Request):
     """Serve a stored attachment file."""
@@ -498,7 +544,7 @@ async def serve_attachment(request: Request):
     if not file_path:
         return JSONResponse({"error": "Attachment file not found"}, status_code=404)
 
-    return FileResponse(
+    return ZeroCopyFileResponse(
         path=str(file_path),
         filename=metadata["filename"],
         media_type=metadata["mime_type"],
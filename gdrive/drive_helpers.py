@@ -6,7 +6,8 @@ Shared utilities for Google Drive operations including permission checking.
 
 import asyncio
 import re
-from typing import List, Dict, Any, Optional, Tuple
+from types import MappingProxyType
+from typing import List, Dict, Any, Mapping, Optional, Tuple
 
 VALID_SHARE_ROLES = {"reader", "commenter", "writer"}
 VALID_SHARE_TYPES = {"user", "group", "domain", "anyone"}
@@ -201,7 +202,9 @@ def build_drive_list_params(
         Dictionary of parameters for Drive API list calls
     """
     if detailed:
-        fields = "nextPageToken, files(id, name, mimeType, webViewLink, iconLink, modifiedTime, size)"
+        fields = (
+            "nextPageToken, files(id, name, mimeType, webViewLink, modifiedTime, size)"
+        )
     else:
         fields = "nextPageToken, files(id, name, mimeType)"
     list_params = {
@@ -235,37 +238,41 @@ MIME_TYPE_PATTERN = re.compile(r"^[A-Za-z0-9!#$&^_.+-]+/[A-Za-z0-9!#$&^_.+-]+$")
 
 # Mapping from friendly type names to Google Drive MIME types.
 # Raw MIME type strings (containing '/') are always accepted as-is.
-FILE_TYPE_MIME_MAP: Dict[str, str] = {
-    "folder": "application/vnd.google-apps.folder",
-    "folders": "application/vnd.google-apps.folder",
-    "document": "application/vnd.google-apps.document",
-    "doc": "application/vnd.google-apps.document",
-    "documents": "application/vnd.google-apps.document",
-    "docs": "application/vnd.google-apps.document",
-    "spreadsheet": "application/vnd.google-apps.spreadsheet",
-    "sheet": "application/vnd.google-apps.spreadsheet",
-    "spreadsheets": "application/vnd.google-apps.spreadsheet",
-    "sheets": "application/vnd.google-apps.spreadsheet",
-    "presentation": "application/vnd.google-apps.presentation",
-    "presentations": "application/vnd.google-apps.presentation",
-    "slide": "application/vnd.google-apps.presentation",
-    "slides": "application/vnd.google-apps.presentation",
-    "form": "application/vnd.google-apps.form",
-    "forms": "application/vnd.google-apps.form",
-    "drawing": "application/vnd.google-apps.drawing",
-    "drawings": "application/vnd.google-apps.drawing",
-    "pdf": "application/pdf",
-    "pdfs": "application/pdf",
-    "shortcut": "application/vnd.google-apps.shortcut",
-    "shortcuts": "application/vnd.google-apps.shortcut",
-    "script": "application/vnd.google-apps.script",
-    "scripts": "application/vnd.google-apps.script",
-    "site": "application/vnd.google-apps.site",
-    "sites": "application/vnd.google-apps.site",
-    "jam": "application/vnd.google-apps.jam",
-    "jamboard": "application/vnd.google-apps.jam",
-    "jamboards": "application/vnd.google-apps.jam",
-}
+# Wrapped in a read-only proxy so the lookup table cannot drift at runtime.
+FILE_TYPE_MIME_MAP: Mapping[str, str] = MappingProxyType(
+    {
+        "folder": "application/vnd.google-apps.folder",
+        "folders": "application/vnd.google-apps.folder",
+        "document": "application/vnd.google-apps.document",
+        "doc": "application/vnd.google-apps.document",
+        "documents": "application/vnd.google-apps.document",
+        "docs": "application/vnd.google-apps.document",
+        "spreadsheet": "application/vnd.google-apps.spreadsheet",
+        "sheet": "application/vnd.google-apps.spreadsheet",
+        "spreadsheets": "application/vnd.google-apps.spreadsheet",
+        "sheets": "application/vnd.google-apps.spreadsheet",
+        "presentation": "application/vnd.google-apps.presentation",
+        "presentations": "application/vnd.google-apps.presentation",
+        "slide": "application/vnd.google-apps.presentation",
+        "slides": "application/vnd.google-apps.presentation",
+        "form": "application/vnd.google-apps.form",
+        "forms": "application/vnd.google-apps.form",
+        "drawing": "application/vnd.google-apps.drawing",
+        "drawings": "application/vnd.google-apps.drawing",
+        "pdf": "application/pdf",
+        "pdfs": "application/pdf",
+        "shortcut": "application/vnd.google-apps.shortcut",
+        "shortcuts": "application/vnd.google-apps.shortcut",
+        "script": "application/vnd.google-apps.script",
+        "scripts": "application/vnd.google-apps.script",
+        "site": "application/vnd.google-apps.site",
+        "sites": "application/vnd.google-apps.site",
+        "jam": "application/vnd.google-apps.jam",
+        "jamboard": "application/vnd.google-apps.jam",
+        "jamboards": "application/vnd.google-apps.jam",
+    }
+)
+_VALID_FILE_TYPE_NAMES = ", ".join(sorted(FILE_TYPE_MIME_MAP))
 
 
 def resolve_file_type_mime(file_type: str) -> str:
@@ -296,14 +303,13 @@ def resolve_file_type_mime(file_type: str) -> str:
                 f"Invalid MIME type '{file_type}'. Expected format like 'application/pdf'."
             )
         return normalized_mime
-    lower = normalized.lower()
-    if lower not in FILE_TYPE_MIME_MAP:
-        valid = ", ".join(sorted(FILE_TYPE_MIME_MAP.keys()))
+    mime = FILE_TYPE_MIME_MAP.get(normalized.lower())
+    if mime is None:
         raise ValueError(
             f"Unknown file_type '{file_type}'. Pass a MIME type directly (e.g. "
-            f"'application/pdf') or use one of the friendly names: {valid}"
+            f"'application/pdf') or use one of the friendly names: {_VALID_FILE_TYPE_NAMES}"
         )
-    return FILE_TYPE_MIME_MAP[lower]
+    return mime
 
 
 BASE_SHORTCUT_FIELDS = (
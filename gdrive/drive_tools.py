@@ -13,7 +13,7 @@ import ipaddress
 import socket
 from contextlib import asynccontextmanager
 
-from typing import AsyncIterator, Optional, List, Dict, Any
+from typing import AsyncIterator, Optional, List, Dict, Any, Tuple
 from tempfile import NamedTemporaryFile
 from urllib.parse import urljoin, urlparse, urlunparse
 from urllib.request import url2pathname
@@ -48,6 +48,8 @@ logger = logging.getLogger(__name__)
 DOWNLOAD_CHUNK_SIZE_BYTES = 256 * 1024  # 256 KB
 UPLOAD_CHUNK_SIZE_BYTES = 5 * 1024 * 1024  # 5 MB (Google recommended minimum)
 MAX_DOWNLOAD_BYTES = 2 * 1024 * 1024 * 1024  # 2 GB safety limit for URL downloads
+CREATE_FIELDS = "id, name, webViewLink"  # Response fields for files().create calls
+DRIVE_BATCH_SIZE = 100  # Drive API limit on requests per batch
 
 
 @server.tool()
@@ -533,7 +535,7 @@ async def _create_drive_folder_impl(
         service.files()
         .create(
             body=file_metadata,
-            fields="id, name, webViewLink",
+            fields=CREATE_FIELDS,
             supportsAllDrives=True,
         )
         .execute
@@ -545,6 +547,72 @@ async def _create_drive_folder_impl(
     )
 
 
+async def _create_drive_folders_batch_impl(
+    service,
+    user_google_email: str,
+    specs: List[Tuple[str, str]],
+) -> str:
+    """Internal implementation for create_drive_folders.
+
+    Each spec is a ``(folder_name, parent_folder_id)`` pair. Requests are sent in
+    batches of up to DRIVE_BATCH_SIZE so N folders cost one round trip per batch
+    instead of one per folder.
+    """
+    resolved_parents: Dict[str, str] = {}
+    for _, parent_folder_id in specs:
+        if parent_folder_id not in resolved_parents:
+            resolved_parents[parent_folder_id] = await resolve_folder_id(
+                service, parent_folder_id
+            )
+
+    results: Dict[str, Dict] = {}
+
+    def _batch_callback(request_id, response, exception):
+        """Callback for batch requests"""
+        results[request_id] = {"data": response, "error": exception}
+
+    for chunk_start in range(0, len(specs), DRIVE_BATCH_SIZE):
+        batch = service.new_batch_http_request(callback=_batch_callback)
+        for index in range(
+            chunk_start, min(chunk_start + DRIVE_BATCH_SIZE, len(specs))
+        ):
+            folder_name, parent_folder_id = specs[index]
+            file_metadata = {
+                "name": folder_name,
+                "parents": [resolved_parents[parent_folder_id]],
+                "mimeType": FOLDER_MIME_TYPE,
+            }
+            batch.add(
+                service.files().create(
+                    body=file_metadata,
+                    fields=CREATE_FIELDS,
+                    supportsAllDrives=True,
+                ),
+                request_id=str(index),
+            )
+        await asyncio.to_thread(batch.execute)
+
+    lines = []
+    created_count = 0
+    for index, (folder_name, parent_folder_id) in enumerate(specs):
+        entry = results.get(str(index), {})
+        created_file = entry.get("data")
+        if entry.get("error") or not created_file:
+            lines.append(
+                f"- Failed to create folder '{folder_name}' in folder '{parent_folder_id}': "
+                f"{entry.get('error') or 'No response received'}"
+            )
+            continue
+        created_count += 1
+        lines.append(
+            f"- '{created_file.get('name', folder_name)}' (ID: {created_file.get('id', 'N/A')}) "
+            f"in folder '{parent_folder_id}'. Link: {created_file.get('webViewLink', '')}"
+        )
+
+    header = f"Created {created_count} of {len(specs)} folders for {user_google_email}:"
+    return "\n".join([header, *lines])
+
+
 @server.tool()
 @handle_http_errors("create_drive_folder", service_type="drive")
 @require_google_service("drive", "drive_file")
@@ -574,6 +642,42 @@ async def create_drive_folder(
     )
 
 
+@server.tool()
+@handle_http_errors("create_drive_folders", service_type="drive")
+@require_google_service("drive", "drive_file")
+async def create_drive_folders(
+    service,
+    user_google_email: str,
+    folder_names: List[str],
+    parent_folder_id: str = "root",
+) -> str:
+    """
+    Creates several folders in Google Drive with batched API requests.
+    Folders are created in batches of up to 100 per round trip.
+
+    Args:
+        user_google_email (str): The user's Google email address. Required.
+        folder_names (List[str]): The names for the new folders.
+        parent_folder_id (str): The ID of the parent folder for all new folders. Defaults to 'root'.
+            For shared drives, use a folder ID within that shared drive.
+
+    Returns:
+        str: Summary of created folders with name, ID, and link, plus any per-folder failures.
+    """
+    logger.info(
+        f"[create_drive_folders] Invoked. Email: '{user_google_email}', Folder count: {len(folder_names)}, Parent: '{parent_folder_id}'"
+    )
+
+    if not folder_names:
+        raise ValueError("No folder names provided")
+
+    return await _create_drive_folders_batch_impl(
+        service,
+        user_google_email,
+        [(folder_name, parent_folder_id) for folder_name in folder_names],
+    )
+
+
 @server.tool()
 @handle_http_errors("create_drive_file", service_type="drive")
 @require_google_service("drive", "drive_file")
@@ -685,7 +789,7 @@ async def create_drive_file(
                 .create(
                     body=file_metadata,
                     media_body=media,
-                    fields="id, name, webViewLink",
+                    fields=CREATE_FIELDS,
                     supportsAllDrives=True,
                 )
                 .execute
@@ -721,7 +825,7 @@ async def create_drive_file(
                     .create(
                         body=file_metadata,
                         media_body=media,
-                        fields="id, name, webViewLink",
+                        fields=CREATE_FIELDS,
                         supportsAllDrives=True,
                     )
                     .execute
@@ -782,7 +886,7 @@ async def create_drive_file(
                         .create(
                             body=file_metadata,
                             media_body=media,
-                            fields="id, name, webViewLink",
+                            fields=CREATE_FIELDS,
                             supportsAllDrives=True,
                         )
                         .execute
@@ -804,7 +908,7 @@ async def create_drive_file(
             .create(
                 body=file_metadata,
                 media_body=MediaIoBaseUpload(media, mimetype=mime_type, resumable=True),
-                fields="id, name, webViewLink",
+                fields=CREATE_FIELDS,
                 supportsAllDrives=True,
             )
             .execute
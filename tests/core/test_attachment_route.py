@@ -2,35 +2,45 @@ import pytest
 from starlette.requests import Request
 from starlette.responses import FileResponse, JSONResponse
 
-from core.server import serve_attachment
+from core.server import ZEROCOPY_SEND_EXTENSION, serve_attachment
 
 
-def _build_request(file_id: str) -> Request:
+_BASE_SCOPE = {
+    "type": "http",
+    "asgi": {"version": "3.0"},
+    "http_version": "1.1",
+    "method": "GET",
+    "scheme": "http",
+    "query_string": b"",
+    "headers": [],
+    "client": ("127.0.0.1", 12345),
+    "server": ("localhost", 8000),
+}
+
+
+async def _noop_receive():
+    return {"type": "http.request", "body": b"", "more_body": False}
+
+
+def _build_request(file_id: str, extensions: dict | None = None) -> Request:
+    path = f"/attachments/{file_id}"
     scope = {
-        "type": "http",
-        "asgi": {"version": "3.0"},
-        "http_version": "1.1",
-        "method": "GET",
-        "scheme": "http",
-        "path": f"/attachments/{file_id}",
-        "raw_path": f"/attachments/{file_id}".encode(),
-        "query_string": b"",
-        "headers": [],
-        "client": ("127.0.0.1", 12345),
-        "server": ("localhost", 8000),
+        **_BASE_SCOPE,
+        "path": path,
+        "raw_path": path.encode(),
         "path_params": {"file_id": file_id},
     }
+    if extensions is not None:
+        scope["extensions"] = extensions
+    return Request(scope, _noop_receive)
 
-    async def receive():
-        return {"type": "http.request", "body": b"", "more_body": False}
 
-    return Request(scope, receive)
+_PDF_BYTES = b"%PDF-1.3\n"
 
 
-@pytest.mark.asyncio
 async def test_serve_attachment_uses_path_param_file_id(monkeypatch, tmp_path):
     file_path = tmp_path / "sample.pdf"
-    file_path.write_bytes(b"%PDF-1.3\n")
+    file_path.write_bytes(_PDF_BYTES)
     captured = {}
 
     class DummyStorage:
@@ -52,7 +62,106 @@ async def test_serve_attachment_uses_path_param_file_id(monkeypatch, tmp_path):
     assert response.status_code == 200
 
 
-@pytest.mark.asyncio
+@pytest.fixture
+def disk_attachment(monkeypatch, tmp_path):
+    """Serve _PDF_BYTES from a file on disk through a stub storage backend."""
+    file_path = tmp_path / "sample.pdf"
+    file_path.write_bytes(_PDF_BYTES)
+
+    class DummyStorage:
+        def get_attachment_metadata(self, _file_id):
+            return {"filename": "sample.pdf", "mime_type": "application/pdf"}
+
+        def get_attachment_path(self, _file_id):
+            return file_path
+
+    monkeypatch.setattr(
+        "core.attachment_storage.get_attachment_storage", lambda: DummyStorage()
+    )
+    return file_path
+
+
+async def _send_response(request: Request) -> list:
+    """Run serve_attachment's response for request and collect sent messages."""
+    response = await serve_attachment(request)
+    sent = []
+
+    async def send(message):
+        sent.append(message)
+
+    await response(request.scope, _noop_receive, send)
+    return sent
+
+
+async def test_serve_attachment_uses_zerocopysend_when_advertised(disk_attachment):
+    request = _build_request("abc123", extensions={ZEROCOPY_SEND_EXTENSION: {}})
+    response = await serve_attachment(request)
+    sent = []
+    file_contents = []
+
+    async def send(message):
+        if message["type"] == ZEROCOPY_SEND_EXTENSION:
+            # The file object is only open while the response is being sent
+            file_contents.append(message["file"].read())
+        sent.append(message)
+
+    await response(request.scope, _noop_receive, send)
+
+    assert [message["type"] for message in sent] == [
+        "http.response.start",
+        ZEROCOPY_SEND_EXTENSION,
+    ]
+    assert sent[0]["status"] == 200
+    assert (b"content-length", b"9") in sent[0]["headers"]
+    assert callable(sent[1]["file"].fileno)
+    assert file_contents == [_PDF_BYTES]
+    assert sent[1]["more_body"] is False
+
+
+async def test_serve_attachment_streams_body_without_zerocopysend(disk_attachment):
+    sent = await _send_response(_build_request("abc123"))
+
+    assert [message["type"] for message in sent] == [
+        "http.response.start",
+        "http.response.body",
+    ]
+    assert sent[0]["status"] == 200
+    assert sent[1]["body"] == _PDF_BYTES
+
+
+async def test_serve_attachment_range_request_skips_zerocopysend(disk_attachment):
+    request = _build_request("abc123", extensions={ZEROCOPY_SEND_EXTENSION: {}})
+    request.scope["headers"] = [(b"range", b"bytes=0-3")]
+
+    sent = await _send_response(request)
+
+    assert sent[0]["status"] == 206
+    assert ZEROCOPY_SEND_EXTENSION not in [message["type"] for message in sent]
+    assert b"".join(m.get("body", b"") for m in sent[1:]) == _PDF_BYTES[:4]
+
+
+async def test_serve_attachment_head_request_skips_zerocopysend(disk_attachment):
+    request = _build_request("abc123", extensions={ZEROCOPY_SEND_EXTENSION: {}})
+    request.scope["method"] = "HEAD"
+
+    sent = await _send_response(request)
+
+    assert [message["type"] for message in sent] == [
+        "http.response.start",
+        "http.response.body",
+    ]
+    assert sent[1]["body"] == b""
+
+
+async def test_serve_attachment_rejects_directory_path(disk_attachment):
+    disk_attachment.unlink()
+    disk_attachment.mkdir()
+    request = _build_request("abc123", extensions={ZEROCOPY_SEND_EXTENSION: {}})
+
+    with pytest.raises(RuntimeError, match="is not a file"):
+        await _send_response(request)
+
+
 async def test_serve_attachment_404_when_metadata_missing(monkeypatch):
     class DummyStorage:
         def get_attachment_metadata(self, _file_id):
@@ -0,0 +1,169 @@
+"""
+Shared fixtures for the Google Drive tool tests.
+"""
+
+import pytest
+
+from gdrive import drive_tools
+
+
+class AsyncStub:
+    """Minimal awaitable stand-in that returns a constant and records calls.
+
+    Much cheaper than ``AsyncMock`` for tests that only need a coroutine
+    returning a fixed value.
+    """
+
+    def __init__(self, return_value=None):
+        self.return_value = return_value
+        self.calls = []
+
+    async def __call__(self, *args, **kwargs):
+        self.calls.append((args, kwargs))
+        return self.return_value
+
+
+class FakeRequest:
+    """Stand-in for an HttpRequest whose execute() returns a canned response.
+
+    When ``respond`` is given it is called on execute() instead, so it can
+    raise to simulate a failed request.
+    """
+
+    def __init__(self, response=None, respond=None):
+        self.response = response
+        self.respond = respond
+
+    def execute(self):
+        if self.respond is not None:
+            return self.respond()
+        return self.response
+
+
+class FakeMethod:
+    """Stand-in for a Drive resource method such as ``files().list``.
+
+    Records the keyword arguments of every call in ``calls`` and returns a
+    FakeRequest for ``response``, or one that runs ``respond(**kwargs)`` on
+    execute() when set.
+    """
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self, response=None):
+        self.response = response
+        self.respond = None
+        self.calls = []
+
+    def __call__(self, **kwargs):
+        self.calls.append(kwargs)
+        if self.respond is not None:
+            respond = self.respond
+            return FakeRequest(respond=lambda: respond(**kwargs))
+        return FakeRequest(self.response)
+
+    @property
+    def kwargs(self):
+        """Keyword arguments of the most recent call."""
+        return self.calls[-1]
+
+
+class FakeFiles:
+    """Stand-in for the ``service.files()`` resource."""
+
+    def __init__(self):
+        self.list = FakeMethod()
+        self.create = FakeMethod()
+
+
+class FakeBatch:
+    """Stand-in for BatchHttpRequest that answers each request on execute().
+
+    A request that raises is reported to the callback as its exception.
+    """
+
+    def __init__(self, callback):
+        self.callback = callback
+        self.requests = []
+
+    def add(self, request, request_id):
+        self.requests.append((request_id, request))
+
+    def execute(self):
+        for request_id, request in self.requests:
+            try:
+                response = request.execute()
+            except Exception as exc:
+                self.callback(request_id, None, exc)
+            else:
+                self.callback(request_id, response, None)
+
+
+class FakeDriveService:
+    """Hand-rolled Drive service exposing only what the Drive tool tests use.
+
+    Plain attributes avoid Mock's child-mock bookkeeping on every access.
+    """
+
+    def __init__(self):
+        self._files = FakeFiles()
+        self.batches = []
+
+    def files(self):
+        return self._files
+
+    def new_batch_http_request(self, callback):
+        self.batches.append(FakeBatch(callback))
+        return self.batches[-1]
+
+    def reset(self, files_list_response, create_response):
+        self._files.list.reset(files_list_response)
+        self._files.create.reset(create_response)
+        self.batches = []
+
+
+@pytest.fixture(scope="session")
+def drive_service_factory():
+    """Build the fake Drive service once per session.
+
+    Returns a callable that clears the shared service's recorded calls and
+    primes the ``files().list()`` / ``files().create()`` responses, so each
+    test starts from a clean service.
+    """
+    service = FakeDriveService()
+
+    def make_service(files_list_response=None, create_response=None):
+        service.reset(
+            files_list_response if files_list_response is not None else {"files": []},
+            create_response if create_response is not None else {},
+        )
+        return service
+
+    return make_service
+
+
+@pytest.fixture
+def mock_service(drive_service_factory):
+    """A freshly reset Drive service whose list() returns no files."""
+    return drive_service_factory()
+
+
+@pytest.fixture
+def mock_resolve_folder(monkeypatch):
+    """Stub resolve_folder_id so Drive tools never hit the shortcut lookup."""
+    stub = AsyncStub("resolved_root")
+    monkeypatch.setattr(drive_tools, "resolve_folder_id", stub)
+    return stub
+
+
+@pytest.fixture
+def list_call(mock_service):
+    """The ``files().list`` method of the shared Drive service."""
+    return mock_service.files().list
+
+
+@pytest.fixture
+def create_call(mock_service):
+    """The ``files().create`` method of the shared Drive service."""
+    return mock_service.files().create
@@ -2,146 +2,223 @@
 Unit tests for create_drive_folder tool.
 """
 
-import os
-import sys
-from unittest.mock import AsyncMock, MagicMock, patch
+import inspect
 
 import pytest
 
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
-
+from gdrive.drive_helpers import FOLDER_MIME_TYPE
+from gdrive.drive_tools import (
+    CREATE_FIELDS,
+    DRIVE_BATCH_SIZE,
+    _create_drive_folders_batch_impl,
+    create_drive_folders,
+)
 from gdrive.drive_tools import _create_drive_folder_impl as _raw_create_drive_folder
 
-
-def _make_service(created_response):
-    """Build a mock Drive service whose files().create().execute returns *created_response*."""
-    execute = MagicMock(return_value=created_response)
-    create = MagicMock()
-    create.return_value.execute = execute
-    files = MagicMock()
-    files.return_value.create = create
-    service = MagicMock()
-    service.files = files
-    return service
+_raw_create_drive_folders = inspect.unwrap(create_drive_folders)
 
 
-@pytest.mark.asyncio
-async def test_create_folder_root_skips_resolve():
-    """Parent 'root' should pass through resolve_folder_id and produce correct output."""
-    api_response = {
-        "id": "new-folder-id",
-        "name": "My Folder",
-        "webViewLink": "https://drive.google.com/drive/folders/new-folder-id",
+def _create_from_body(body, fields, supportsAllDrives):
+    return {
+        "id": f"{body['name']}-id",
+        "name": body["name"],
+        "webViewLink": f"https://drive.google.com/drive/folders/{body['name']}-id",
     }
-    service = _make_service(api_response)
-
-    with patch(
-        "gdrive.drive_tools.resolve_folder_id",
-        new_callable=AsyncMock,
-        return_value="root",
-    ):
-        result = await _raw_create_drive_folder(
-            service,
-            user_google_email="user@example.com",
-            folder_name="My Folder",
-            parent_folder_id="root",
-        )
-
-    assert "new-folder-id" in result
-    assert "My Folder" in result
-    assert "https://drive.google.com/drive/folders/new-folder-id" in result
 
 
-@pytest.mark.asyncio
-async def test_create_folder_custom_parent_resolves():
+async def test_create_folder_custom_parent_resolves(
+    drive_service_factory, create_call, mock_resolve_folder
+):
     """A non-root parent_folder_id should go through resolve_folder_id."""
     api_response = {
         "id": "new-folder-id",
         "name": "Sub Folder",
         "webViewLink": "https://drive.google.com/drive/folders/new-folder-id",
     }
-    service = _make_service(api_response)
-
-    with patch(
-        "gdrive.drive_tools.resolve_folder_id",
-        new_callable=AsyncMock,
-        return_value="resolved-parent-id",
-    ) as mock_resolve:
-        result = await _raw_create_drive_folder(
-            service,
-            user_google_email="user@example.com",
-            folder_name="Sub Folder",
-            parent_folder_id="shortcut-id",
-        )
+    service = drive_service_factory(create_response=api_response)
+
+    mock_resolve_folder.return_value = "resolved-parent-id"
+    result = await _raw_create_drive_folder(
+        service,
+        user_google_email="user@example.com",
+        folder_name="Sub Folder",
+        parent_folder_id="shortcut-id",
+    )
 
-    mock_resolve.assert_awaited_once_with(service, "shortcut-id")
+    assert mock_resolve_folder.calls == [((service, "shortcut-id"), {})]
     # The output message uses the original parent_folder_id, not the resolved one
     assert "shortcut-id" in result
     # But the API call should use the resolved ID
-    service.files().create.assert_called_once_with(
-        body={
-            "name": "Sub Folder",
-            "mimeType": "application/vnd.google-apps.folder",
-            "parents": ["resolved-parent-id"],
-        },
-        fields="id, name, webViewLink",
-        supportsAllDrives=True,
-    )
+    assert create_call.calls == [
+        dict(
+            body={
+                "name": "Sub Folder",
+                "mimeType": FOLDER_MIME_TYPE,
+                "parents": ["resolved-parent-id"],
+            },
+            fields=CREATE_FIELDS,
+            supportsAllDrives=True,
+        )
+    ]
 
 
-@pytest.mark.asyncio
-async def test_create_folder_passes_correct_metadata():
+async def test_create_folder_passes_correct_metadata(
+    drive_service_factory, create_call, mock_resolve_folder
+):
     """Verify the metadata dict sent to the Drive API is correct."""
     api_response = {
         "id": "abc123",
         "name": "Test",
         "webViewLink": "https://drive.google.com/drive/folders/abc123",
     }
-    service = _make_service(api_response)
-
-    with patch(
-        "gdrive.drive_tools.resolve_folder_id",
-        new_callable=AsyncMock,
-        return_value="resolved-id",
-    ):
-        await _raw_create_drive_folder(
-            service,
-            user_google_email="user@example.com",
-            folder_name="Test",
-            parent_folder_id="some-parent",
-        )
-
-    service.files().create.assert_called_once_with(
-        body={
-            "name": "Test",
-            "mimeType": "application/vnd.google-apps.folder",
-            "parents": ["resolved-id"],
-        },
-        fields="id, name, webViewLink",
-        supportsAllDrives=True,
+    service = drive_service_factory(create_response=api_response)
+
+    mock_resolve_folder.return_value = "resolved-id"
+    await _raw_create_drive_folder(
+        service,
+        user_google_email="user@example.com",
+        folder_name="Test",
+        parent_folder_id="some-parent",
     )
 
+    assert create_call.calls == [
+        dict(
+            body={
+                "name": "Test",
+                "mimeType": FOLDER_MIME_TYPE,
+                "parents": ["resolved-id"],
+            },
+            fields=CREATE_FIELDS,
+            supportsAllDrives=True,
+        )
+    ]
+
 
-@pytest.mark.asyncio
-async def test_create_folder_missing_webviewlink():
+async def test_create_folder_missing_webviewlink(
+    drive_service_factory, mock_resolve_folder
+):
     """When the API omits webViewLink, the result should have an empty link."""
     api_response = {
         "id": "abc123",
         "name": "NoLink",
     }
-    service = _make_service(api_response)
-
-    with patch(
-        "gdrive.drive_tools.resolve_folder_id",
-        new_callable=AsyncMock,
-        return_value="root",
-    ):
-        result = await _raw_create_drive_folder(
-            service,
-            user_google_email="user@example.com",
-            folder_name="NoLink",
-            parent_folder_id="root",
-        )
+    service = drive_service_factory(create_response=api_response)
+
+    mock_resolve_folder.return_value = "root"
+    result = await _raw_create_drive_folder(
+        service,
+        user_google_email="user@example.com",
+        folder_name="NoLink",
+        parent_folder_id="root",
+    )
 
     assert "abc123" in result
     assert "NoLink" in result
+
+
+async def test_create_folders_batch_single_round_trip(
+    mock_service, create_call, mock_resolve_folder
+):
+    """Bulk folder creation goes through one batch request and reports each folder."""
+
+    create_call.respond = _create_from_body
+    mock_resolve_folder.return_value = "resolved-id"
+
+    result = await _create_drive_folders_batch_impl(
+        mock_service,
+        user_google_email="user@example.com",
+        specs=[("Alpha", "root"), ("Beta", "root")],
+    )
+
+    assert len(mock_service.batches) == 1
+    assert len(mock_service.batches[0].requests) == 2
+    # Shared parents are resolved once
+    assert mock_resolve_folder.calls == [((mock_service, "root"), {})]
+    assert "Created 2 of 2 folders" in result
+    assert "Alpha-id" in result
+    assert "Beta-id" in result
+
+
+async def test_create_folders_batch_reports_per_request_failures(
+    mock_service, create_call, mock_resolve_folder
+):
+    """Failed or empty batch responses are reported per folder; the rest succeed."""
+
+    def create(body, fields, supportsAllDrives):
+        if body["name"] == "Beta":
+            raise RuntimeError("quota exceeded")
+        if body["name"] == "Gamma":
+            return None
+        return _create_from_body(body, fields, supportsAllDrives)
+
+    create_call.respond = create
+
+    result = await _create_drive_folders_batch_impl(
+        mock_service,
+        user_google_email="user@example.com",
+        specs=[("Alpha", "root"), ("Beta", "root"), ("Gamma", "root")],
+    )
+
+    assert "Created 1 of 3 folders" in result
+    assert "Alpha-id" in result
+    assert "Failed to create folder 'Beta' in folder 'root': quota exceeded" in result
+    assert (
+        "Failed to create folder 'Gamma' in folder 'root': No response received"
+        in result
+    )
+    assert ": None" not in result
+
+
+async def test_create_folders_batch_splits_at_batch_size(
+    mock_service, create_call, mock_resolve_folder
+):
+    """More than DRIVE_BATCH_SIZE folders are spread over several batch requests."""
+    create_call.respond = _create_from_body
+    count = DRIVE_BATCH_SIZE + 1
+
+    result = await _create_drive_folders_batch_impl(
+        mock_service,
+        user_google_email="user@example.com",
+        specs=[(f"F{i}", "root") for i in range(count)],
+    )
+
+    assert [len(batch.requests) for batch in mock_service.batches] == [
+        DRIVE_BATCH_SIZE,
+        1,
+    ]
+    request_ids = [rid for batch in mock_service.batches for rid, _ in batch.requests]
+    assert request_ids == [str(i) for i in range(count)]
+    assert f"Created {count} of {count} folders" in result
+    assert f"F{count - 1}-id" in result
+
+
+async def test_create_drive_folders_tool_uses_one_parent(
+    mock_service, create_call, mock_resolve_folder
+):
+    """create_drive_folders creates every named folder under the given parent."""
+    create_call.respond = _create_from_body
+    mock_resolve_folder.return_value = "resolved-parent-id"
+
+    result = await _raw_create_drive_folders(
+        mock_service,
+        user_google_email="user@example.com",
+        folder_names=["Alpha", "Beta"],
+        parent_folder_id="shortcut-id",
+    )
+
+    assert mock_resolve_folder.calls == [((mock_service, "shortcut-id"), {})]
+    assert [call["body"]["parents"] for call in create_call.calls] == [
+        ["resolved-parent-id"],
+        ["resolved-parent-id"],
+    ]
+    assert "Created 2 of 2 folders" in result
+
+
+async def test_create_drive_folders_tool_requires_names(mock_service):
+    """An empty folder list is rejected before any API call."""
+    with pytest.raises(ValueError, match="No folder names provided"):
+        await _raw_create_drive_folders(
+            mock_service,
+            user_google_email="user@example.com",
+            folder_names=[],
+        )
@@ -6,15 +6,23 @@ Tests create_drive_folder with mocked API responses, plus coverage for
 and `file_type` filtering behaviors.
 """
 
+import inspect
+import re
+
 import pytest
-from unittest.mock import Mock, AsyncMock, patch
-import sys
-import os
 
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "../..")))
+from gdrive.drive_helpers import (
+    FOLDER_MIME_TYPE,
+    build_drive_list_params,
+    resolve_file_type_mime,
+)
+from gdrive.drive_tools import (
+    _create_drive_folder_impl,
+    list_drive_items,
+    search_drive_files,
+)
 
-from gdrive.drive_helpers import build_drive_list_params
-from gdrive.drive_tools import list_drive_items, search_drive_files
+pytestmark = pytest.mark.usefixtures("mock_resolve_folder")
 
 
 def _unwrap(tool):
@@ -23,205 +31,144 @@ def _unwrap(tool):
     Handles both older FastMCP (FunctionTool with .fn) and newer FastMCP
     (server.tool() returns the function directly).
     """
-    fn = tool.fn if hasattr(tool, "fn") else tool
-    while hasattr(fn, "__wrapped__"):
-        fn = fn.__wrapped__
-    return fn
+    return inspect.unwrap(getattr(tool, "fn", tool))
+
+
+_SEARCH = _unwrap(search_drive_files)
+_LIST = _unwrap(list_drive_items)
 
 
 # ---------------------------------------------------------------------------
-# search_drive_files — page_token
+# Helpers
 # ---------------------------------------------------------------------------
 
 
-@pytest.mark.asyncio
-async def test_search_drive_files_page_token_passed_to_api():
-    """page_token is forwarded to the Drive API as pageToken."""
-    mock_service = Mock()
-    mock_service.files().list().execute.return_value = {
-        "files": [
-            {
-                "id": "f1",
-                "name": "Report.pdf",
-                "mimeType": "application/pdf",
-                "webViewLink": "https://drive.google.com/file/f1",
-                "modifiedTime": "2024-01-01T00:00:00Z",
-            }
-        ]
-    }
+_DOC_MIME = "application/vnd.google-apps.document"
+_SHEET_MIME = "application/vnd.google-apps.spreadsheet"
+_PDF_MIME = "application/pdf"
 
-    await _unwrap(search_drive_files)(
-        service=mock_service,
-        user_google_email="user@example.com",
-        query="budget",
-        page_token="tok_abc123",
-    )
+_FILE_DEFAULTS = {
+    "webViewLink": "http://link",
+    "modifiedTime": "2024-01-01T00:00:00Z",
+}
 
-    call_kwargs = mock_service.files.return_value.list.call_args.kwargs
-    assert call_kwargs.get("pageToken") == "tok_abc123"
 
+def _make_file(
+    file_id: str,
+    name: str,
+    mime_type: str,
+    link: str | None = None,
+    modified: str | None = None,
+    size: str | None = None,
+) -> dict:
+    item = {**_FILE_DEFAULTS, "id": file_id, "name": name, "mimeType": mime_type}
+    if link is not None:
+        item["webViewLink"] = link
+    if modified is not None:
+        item["modifiedTime"] = modified
+    if size is not None:
+        item["size"] = size
+    return item
 
-@pytest.mark.asyncio
-async def test_search_drive_files_next_page_token_in_output():
-    """nextPageToken from the API response is appended at the end of the output."""
-    mock_service = Mock()
-    mock_service.files().list().execute.return_value = {
-        "files": [
-            {
-                "id": "f2",
-                "name": "Notes.docx",
-                "mimeType": "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
-                "webViewLink": "https://drive.google.com/file/f2",
-                "modifiedTime": "2024-02-01T00:00:00Z",
-            }
-        ],
-        "nextPageToken": "next_tok_xyz",
-    }
 
-    result = await _unwrap(search_drive_files)(
-        service=mock_service,
-        user_google_email="user@example.com",
-        query="notes",
-    )
+def _detailed_kwargs(detailed: bool | None) -> dict:
+    return {} if detailed is None else {"detailed": detailed}
 
-    assert result.endswith("nextPageToken: next_tok_xyz")
 
+def _field_names(fields: str) -> frozenset:
+    """Split a partial-response mask into its individual field names."""
+    return frozenset(re.findall(r"\w+", fields))
 
-@pytest.mark.asyncio
-async def test_search_drive_files_no_next_page_token_when_absent():
-    """nextPageToken does not appear in output when the API has no more pages."""
-    mock_service = Mock()
-    mock_service.files().list().execute.return_value = {
-        "files": [
-            {
-                "id": "f3",
-                "name": "Summary.txt",
-                "mimeType": "text/plain",
-                "webViewLink": "https://drive.google.com/file/f3",
-                "modifiedTime": "2024-03-01T00:00:00Z",
-            }
-        ]
-        # no nextPageToken key
-    }
 
-    result = await _unwrap(search_drive_files)(
-        service=mock_service,
-        user_google_email="user@example.com",
-        query="summary",
+_DOC_F1 = _make_file(
+    "f1",
+    "My Doc",
+    _DOC_MIME,
+    modified="2024-06-01T12:00:00Z",
+    link="http://link/f1",
+)
+_DOC_F1_LIST = {"files": [_DOC_F1]}
+_DOC_F1_SIZED_LIST = {"files": [{**_DOC_F1, "size": "102400"}]}
+
+_NEXT_TOK = "nextPageToken: {}".format
+
+# Longest first so "f1" never matches inside the link.
+_F1_TOKEN_RE = re.compile(
+    "|".join(
+        map(
+            re.escape,
+            ("http://link/f1", "2024-06-01T12:00:00Z", "102400", "My Doc", "f1"),
+        )
     )
+)
 
-    assert "nextPageToken" not in result
 
+def _f1_tokens(result: str) -> set:
+    """Distinct _DOC_F1 values rendered in result, found in a single scan."""
+    return {m.group(0) for m in _F1_TOKEN_RE.finditer(result)}
 
-# ---------------------------------------------------------------------------
-# list_drive_items — page_token
-# ---------------------------------------------------------------------------
 
+def _expected_f1_tokens(detailed: bool | None, with_size: bool) -> set:
+    expected = {"My Doc", "f1"}
+    if detailed is not False:
+        expected |= {"2024-06-01T12:00:00Z", "http://link/f1"}
+        if with_size:
+            expected.add("102400")
+    return expected
 
-@pytest.mark.asyncio
-@patch("gdrive.drive_tools.resolve_folder_id", new_callable=AsyncMock)
-async def test_list_drive_items_page_token_passed_to_api(mock_resolve_folder):
-    """page_token is forwarded to the Drive API as pageToken."""
-    mock_resolve_folder.return_value = "root"
-    mock_service = Mock()
-    mock_service.files().list().execute.return_value = {
-        "files": [
-            {
-                "id": "folder1",
-                "name": "Archive",
-                "mimeType": "application/vnd.google-apps.folder",
-                "webViewLink": "https://drive.google.com/drive/folders/folder1",
-                "modifiedTime": "2024-01-15T00:00:00Z",
-            }
-        ]
-    }
 
-    await _unwrap(list_drive_items)(
-        service=mock_service,
-        user_google_email="user@example.com",
-        page_token="tok_page2",
-    )
+# ---------------------------------------------------------------------------
+# search_drive_files / list_drive_items — pagination
+# ---------------------------------------------------------------------------
 
-    call_kwargs = mock_service.files.return_value.list.call_args.kwargs
-    assert call_kwargs.get("pageToken") == "tok_page2"
 
+def _page(next_page_token: str | None) -> dict:
+    if next_page_token is None:
+        return _DOC_F1_LIST
+    return {**_DOC_F1_LIST, "nextPageToken": next_page_token}
 
-@pytest.mark.asyncio
-@patch("gdrive.drive_tools.resolve_folder_id", new_callable=AsyncMock)
-async def test_list_drive_items_next_page_token_in_output(mock_resolve_folder):
-    """nextPageToken from the API response is appended at the end of the output."""
-    mock_resolve_folder.return_value = "root"
-    mock_service = Mock()
-    mock_service.files().list().execute.return_value = {
-        "files": [
-            {
-                "id": "file99",
-                "name": "data.csv",
-                "mimeType": "text/csv",
-                "webViewLink": "https://drive.google.com/file/file99",
-                "modifiedTime": "2024-04-01T00:00:00Z",
-            }
-        ],
-        "nextPageToken": "next_list_tok",
-    }
 
-    result = await _unwrap(list_drive_items)(
+@pytest.mark.parametrize("next_page_token", ["next_tok_xyz", None])
+@pytest.mark.parametrize("page_token", ["tok_abc123", None])
+async def test_search_drive_files_pagination(
+    mock_service, list_call, page_token, next_page_token
+):
+    """page_token is forwarded as pageToken; a returned nextPageToken ends the output."""
+    list_call.response = _page(next_page_token)
+
+    result = await _SEARCH(
         service=mock_service,
         user_google_email="user@example.com",
+        query="budget",
+        page_token=page_token,
     )
 
-    assert result.endswith("nextPageToken: next_list_tok")
+    assert list_call.kwargs.get("pageToken") == page_token
+    if next_page_token:
+        assert result.endswith(_NEXT_TOK(next_page_token))
+    else:
+        assert "nextPageToken" not in result
 
 
-@pytest.mark.asyncio
-@patch("gdrive.drive_tools.resolve_folder_id", new_callable=AsyncMock)
-async def test_list_drive_items_no_next_page_token_when_absent(mock_resolve_folder):
-    """nextPageToken does not appear in output when the API has no more pages."""
-    mock_resolve_folder.return_value = "root"
-    mock_service = Mock()
-    mock_service.files().list().execute.return_value = {
-        "files": [
-            {
-                "id": "file100",
-                "name": "readme.txt",
-                "mimeType": "text/plain",
-                "webViewLink": "https://drive.google.com/file/file100",
-                "modifiedTime": "2024-05-01T00:00:00Z",
-            }
-        ]
-        # no nextPageToken key
-    }
+@pytest.mark.parametrize("next_page_token", ["next_list_tok", None])
+@pytest.mark.parametrize("page_token", ["tok_page2", None])
+async def test_list_drive_items_pagination(
+    mock_service, list_call, page_token, next_page_token
+):
+    """page_token is forwarded as pageToken; a returned nextPageToken ends the output."""
+    list_call.response = _page(next_page_token)
 
-    result = await _unwrap(list_drive_items)(
+    result = await _LIST(
         service=mock_service,
         user_google_email="user@example.com",
+        page_token=page_token,
     )
 
-    assert "nextPageToken" not in result
-
-
-# Helpers
-# ---------------------------------------------------------------------------
-
-
-def _make_file(
-    file_id: str,
-    name: str,
-    mime_type: str,
-    link: str = "http://link",
-    modified: str = "2024-01-01T00:00:00Z",
-    size: str | None = None,
-) -> dict:
-    item = {
-        "id": file_id,
-        "name": name,
-        "mimeType": mime_type,
-        "webViewLink": link,
-        "modifiedTime": modified,
-    }
-    if size is not None:
-        item["size"] = size
-    return item
+    assert list_call.kwargs.get("pageToken") == page_token
+    if next_page_token:
+        assert result.endswith(_NEXT_TOK(next_page_token))
+    else:
+        assert "nextPageToken" not in result
 
 
 # ---------------------------------------------------------------------------
@@ -229,36 +176,35 @@ def _make_file(
 # ---------------------------------------------------------------------------
 
 
-@pytest.mark.asyncio
-async def test_create_drive_folder():
-    """Test create_drive_folder returns success message with folder id, name, and link."""
-    from gdrive.drive_tools import _create_drive_folder_impl
+@pytest.mark.parametrize(
+    "parent_folder_id,resolved_id",
+    [("root", "root"), ("shortcut-id", "resolved-parent-id")],
+)
+async def test_create_drive_folder(
+    drive_service_factory, mock_resolve_folder, parent_folder_id, resolved_id
+):
+    """create_drive_folder resolves the parent and reports the folder id, name, and link."""
+    mock_resolve_folder.return_value = resolved_id
+    mock_service = drive_service_factory(
+        create_response={
+            "id": "folder123",
+            "name": "My Folder",
+            "webViewLink": "https://drive.google.com/drive/folders/folder123",
+        }
+    )
 
-    mock_service = Mock()
-    mock_response = {
-        "id": "folder123",
-        "name": "My Folder",
-        "webViewLink": "https://drive.google.com/drive/folders/folder123",
-    }
-    mock_request = Mock()
-    mock_request.execute.return_value = mock_response
-    mock_service.files.return_value.create.return_value = mock_request
-
-    with patch(
-        "gdrive.drive_tools.resolve_folder_id",
-        new_callable=AsyncMock,
-        return_value="root",
-    ):
-        result = await _create_drive_folder_impl(
-            service=mock_service,
-            user_google_email="user@example.com",
-            folder_name="My Folder",
-            parent_folder_id="root",
-        )
+    result = await _create_drive_folder_impl(
+        service=mock_service,
+        user_google_email="user@example.com",
+        folder_name="My Folder",
+        parent_folder_id=parent_folder_id,
+    )
 
+    assert mock_resolve_folder.calls == [((mock_service, parent_folder_id), {})]
     assert "Successfully created folder" in result
     assert "My Folder" in result
     assert "folder123" in result
+    assert f"in folder '{parent_folder_id}'" in result
     assert "user@example.com" in result
     assert "https://drive.google.com/drive/folders/folder123" in result
 
@@ -268,35 +214,37 @@ async def test_create_drive_folder():
 # ---------------------------------------------------------------------------
 
 
-def test_build_params_detailed_true_includes_extra_fields():
-    """detailed=True requests modifiedTime, webViewLink, and size from the API."""
-    params = build_drive_list_params(query="name='x'", page_size=10, detailed=True)
-    assert "modifiedTime" in params["fields"]
-    assert "webViewLink" in params["fields"]
-    assert "size" in params["fields"]
+_CORE_FIELDS = frozenset({"id", "name", "mimeType"})
+_EXTRA_FIELDS = frozenset({"modifiedTime", "webViewLink", "size"})
 
+# (detailed, expected, excluded); detailed=None means the kwarg is omitted.
+_DETAILED_FIELD_CASES = pytest.mark.parametrize(
+    "detailed,expected,excluded",
+    [
+        (True, _CORE_FIELDS | _EXTRA_FIELDS, frozenset()),
+        (False, _CORE_FIELDS, _EXTRA_FIELDS),
+        (None, _CORE_FIELDS | _EXTRA_FIELDS, frozenset()),
+    ],
+    ids=["detailed", "compact", "default"],
+)
 
-def test_build_params_detailed_false_omits_extra_fields():
-    """detailed=False omits modifiedTime, webViewLink, and size from the API request."""
-    params = build_drive_list_params(query="name='x'", page_size=10, detailed=False)
-    assert "modifiedTime" not in params["fields"]
-    assert "webViewLink" not in params["fields"]
-    assert "size" not in params["fields"]
 
-
-def test_build_params_detailed_false_keeps_core_fields():
-    """detailed=False still requests id, name, and mimeType."""
-    params = build_drive_list_params(query="name='x'", page_size=10, detailed=False)
-    assert "id" in params["fields"]
-    assert "name" in params["fields"]
-    assert "mimeType" in params["fields"]
+@_DETAILED_FIELD_CASES
+def test_build_params_detailed_controls_fields(detailed, expected, excluded):
+    """detailed (default True) decides whether size, modified time, and link are requested."""
+    params = build_drive_list_params(
+        query="name='x'", page_size=10, **_detailed_kwargs(detailed)
+    )
+    fields = _field_names(params["fields"])
+    assert expected <= fields
+    assert not excluded & fields
 
 
-def test_build_params_default_is_detailed():
-    """Omitting detailed behaves identically to detailed=True."""
-    params_default = build_drive_list_params(query="q", page_size=5)
-    params_true = build_drive_list_params(query="q", page_size=5, detailed=True)
-    assert params_default["fields"] == params_true["fields"]
+def test_build_params_fields_mask_only_requests_rendered_fields():
+    """The partial-response mask asks only for fields the tools actually render."""
+    params = build_drive_list_params(query="name='x'", page_size=10, detailed=True)
+    assert params["fields"].startswith("nextPageToken")
+    assert "iconLink" not in _field_names(params["fields"])
 
 
 # ---------------------------------------------------------------------------
@@ -304,149 +252,47 @@ def test_build_params_default_is_detailed():
 # ---------------------------------------------------------------------------
 
 
-@pytest.mark.asyncio
-async def test_search_detailed_true_output_includes_metadata():
-    """detailed=True (default) includes modified time and link in output."""
-    mock_service = Mock()
-    mock_service.files().list().execute.return_value = {
-        "files": [
-            _make_file(
-                "f1",
-                "My Doc",
-                "application/vnd.google-apps.document",
-                modified="2024-06-01T12:00:00Z",
-                link="http://link/f1",
-            )
-        ]
-    }
-
-    result = await _unwrap(search_drive_files)(
-        service=mock_service,
-        user_google_email="user@example.com",
-        query="my doc",
-        detailed=True,
-    )
-
-    assert "My Doc" in result
-    assert "2024-06-01T12:00:00Z" in result
-    assert "http://link/f1" in result
-
-
-@pytest.mark.asyncio
-async def test_search_detailed_false_output_excludes_metadata():
-    """detailed=False omits modified time and link from output."""
-    mock_service = Mock()
-    mock_service.files().list().execute.return_value = {
-        "files": [
-            _make_file(
-                "f1",
-                "My Doc",
-                "application/vnd.google-apps.document",
-                modified="2024-06-01T12:00:00Z",
-                link="http://link/f1",
-            )
-        ]
-    }
+@pytest.mark.parametrize("with_size", [False, True])
+@pytest.mark.parametrize("detailed", [True, False, None])
+async def test_search_detailed_controls_output_metadata(
+    mock_service, list_call, detailed, with_size
+):
+    """detailed (default True) includes modified time, link, and size in output."""
+    list_call.response = _DOC_F1_SIZED_LIST if with_size else _DOC_F1_LIST
 
-    result = await _unwrap(search_drive_files)(
+    result = await _SEARCH(
         service=mock_service,
         user_google_email="user@example.com",
         query="my doc",
-        detailed=False,
-    )
-
-    assert "My Doc" in result
-    assert "f1" in result
-    assert "2024-06-01T12:00:00Z" not in result
-    assert "http://link/f1" not in result
-
-
-@pytest.mark.asyncio
-async def test_search_detailed_true_with_size():
-    """When the item has a size field, detailed=True includes it in output."""
-    mock_service = Mock()
-    mock_service.files().list().execute.return_value = {
-        "files": [
-            _make_file("f2", "Big File", "application/pdf", size="102400"),
-        ]
-    }
-
-    result = await _unwrap(search_drive_files)(
-        service=mock_service,
-        user_google_email="user@example.com",
-        query="big",
-        detailed=True,
+        **_detailed_kwargs(detailed),
     )
 
-    assert "102400" in result
+    assert _f1_tokens(result) == _expected_f1_tokens(detailed, with_size)
 
 
-@pytest.mark.asyncio
-async def test_search_detailed_true_requests_extra_api_fields():
-    """detailed=True passes full fields string to the Drive API."""
-    mock_service = Mock()
-    mock_service.files().list().execute.return_value = {"files": []}
-
-    await _unwrap(search_drive_files)(
+@_DETAILED_FIELD_CASES
+async def test_search_detailed_controls_api_fields(
+    mock_service, list_call, detailed, expected, excluded
+):
+    """detailed (default True) decides whether size, modified time, and link are requested."""
+    await _SEARCH(
         service=mock_service,
         user_google_email="user@example.com",
         query="anything",
-        detailed=True,
+        **_detailed_kwargs(detailed),
     )
 
-    call_kwargs = mock_service.files.return_value.list.call_args.kwargs
-    assert "modifiedTime" in call_kwargs["fields"]
-    assert "webViewLink" in call_kwargs["fields"]
-    assert "size" in call_kwargs["fields"]
-
+    fields = _field_names(list_call.kwargs["fields"])
+    assert expected <= fields
+    assert not excluded & fields
 
-@pytest.mark.asyncio
-async def test_search_detailed_false_requests_compact_api_fields():
-    """detailed=False passes compact fields string to the Drive API."""
-    mock_service = Mock()
-    mock_service.files().list().execute.return_value = {"files": []}
-
-    await _unwrap(search_drive_files)(
-        service=mock_service,
-        user_google_email="user@example.com",
-        query="anything",
-        detailed=False,
-    )
 
-    call_kwargs = mock_service.files.return_value.list.call_args.kwargs
-    assert "modifiedTime" not in call_kwargs["fields"]
-    assert "webViewLink" not in call_kwargs["fields"]
-    assert "size" not in call_kwargs["fields"]
-
-
-@pytest.mark.asyncio
-async def test_search_default_detailed_matches_detailed_true():
-    """Omitting detailed produces the same output as detailed=True."""
-    file = _make_file(
-        "f1",
-        "Doc",
-        "application/vnd.google-apps.document",
-        modified="2024-01-01T00:00:00Z",
-        link="http://l",
-    )
-
-    mock_service = Mock()
-    mock_service.files().list().execute.return_value = {"files": [file]}
-    result_default = await _unwrap(search_drive_files)(
-        service=mock_service,
-        user_google_email="user@example.com",
-        query="doc",
-    )
-
-    mock_service.files().list().execute.return_value = {"files": [file]}
-    result_true = await _unwrap(search_drive_files)(
-        service=mock_service,
-        user_google_email="user@example.com",
-        query="doc",
-        detailed=True,
-    )
-
-    assert result_default == result_true
+@pytest.mark.parametrize(
+    "func", [_SEARCH, _LIST, build_drive_list_params], ids=lambda f: f.__name__
+)
+def test_detailed_defaults_to_true(func):
+    """Omitting detailed behaves identically to detailed=True."""
+    assert inspect.signature(func).parameters["detailed"].default is True
 
 
 # ---------------------------------------------------------------------------
@@ -454,129 +300,39 @@ async def test_search_default_detailed_matches_detailed_true():
 # ---------------------------------------------------------------------------
 
 
-@pytest.mark.asyncio
-@patch("gdrive.drive_tools.resolve_folder_id", new_callable=AsyncMock)
-async def test_list_detailed_true_output_includes_metadata(mock_resolve_folder):
-    """detailed=True (default) includes modified time and link in output."""
-    mock_resolve_folder.return_value = "resolved_root"
-    mock_service = Mock()
-    mock_service.files().list().execute.return_value = {
-        "files": [
-            _make_file(
-                "id1",
-                "Report",
-                "application/vnd.google-apps.document",
-                modified="2024-03-15T08:00:00Z",
-                link="http://link/id1",
-            )
-        ]
-    }
-
-    result = await _unwrap(list_drive_items)(
-        service=mock_service,
-        user_google_email="user@example.com",
-        folder_id="root",
-        detailed=True,
-    )
-
-    assert "Report" in result
-    assert "2024-03-15T08:00:00Z" in result
-    assert "http://link/id1" in result
-
-
-@pytest.mark.asyncio
-@patch("gdrive.drive_tools.resolve_folder_id", new_callable=AsyncMock)
-async def test_list_detailed_false_output_excludes_metadata(mock_resolve_folder):
-    """detailed=False omits modified time and link from output."""
-    mock_resolve_folder.return_value = "resolved_root"
-    mock_service = Mock()
-    mock_service.files().list().execute.return_value = {
-        "files": [
-            _make_file(
-                "id1",
-                "Report",
-                "application/vnd.google-apps.document",
-                modified="2024-03-15T08:00:00Z",
-                link="http://link/id1",
-            )
-        ]
-    }
-
-    result = await _unwrap(list_drive_items)(
-        service=mock_service,
-        user_google_email="user@example.com",
-        folder_id="root",
-        detailed=False,
-    )
-
-    assert "Report" in result
-    assert "id1" in result
-    assert "2024-03-15T08:00:00Z" not in result
-    assert "http://link/id1" not in result
-
-
-@pytest.mark.asyncio
-@patch("gdrive.drive_tools.resolve_folder_id", new_callable=AsyncMock)
-async def test_list_detailed_true_with_size(mock_resolve_folder):
-    """When item has a size field, detailed=True includes it in output."""
-    mock_resolve_folder.return_value = "resolved_root"
-    mock_service = Mock()
-    mock_service.files().list().execute.return_value = {
-        "files": [
-            _make_file("id2", "Big File", "application/pdf", size="204800"),
-        ]
-    }
-
-    result = await _unwrap(list_drive_items)(
-        service=mock_service,
-        user_google_email="user@example.com",
-        folder_id="root",
-        detailed=True,
-    )
-
-    assert "204800" in result
-
-
-@pytest.mark.asyncio
-@patch("gdrive.drive_tools.resolve_folder_id", new_callable=AsyncMock)
-async def test_list_detailed_true_requests_extra_api_fields(mock_resolve_folder):
-    """detailed=True passes full fields string to the Drive API."""
-    mock_resolve_folder.return_value = "resolved_root"
-    mock_service = Mock()
-    mock_service.files().list().execute.return_value = {"files": []}
+@pytest.mark.parametrize("with_size", [False, True])
+@pytest.mark.parametrize("detailed", [True, False, None])
+async def test_list_detailed_controls_output_metadata(
+    mock_service, list_call, detailed, with_size
+):
+    """detailed (default True) includes modified time, link, and size in output."""
+    list_call.response = _DOC_F1_SIZED_LIST if with_size else _DOC_F1_LIST
 
-    await _unwrap(list_drive_items)(
+    result = await _LIST(
         service=mock_service,
         user_google_email="user@example.com",
         folder_id="root",
-        detailed=True,
+        **_detailed_kwargs(detailed),
     )
 
-    call_kwargs = mock_service.files.return_value.list.call_args.kwargs
-    assert "modifiedTime" in call_kwargs["fields"]
-    assert "webViewLink" in call_kwargs["fields"]
-    assert "size" in call_kwargs["fields"]
+    assert _f1_tokens(result) == _expected_f1_tokens(detailed, with_size)
 
 
-@pytest.mark.asyncio
-@patch("gdrive.drive_tools.resolve_folder_id", new_callable=AsyncMock)
-async def test_list_detailed_false_requests_compact_api_fields(mock_resolve_folder):
-    """detailed=False passes compact fields string to the Drive API."""
-    mock_resolve_folder.return_value = "resolved_root"
-    mock_service = Mock()
-    mock_service.files().list().execute.return_value = {"files": []}
-
-    await _unwrap(list_drive_items)(
+@_DETAILED_FIELD_CASES
+async def test_list_detailed_controls_api_fields(
+    mock_service, list_call, detailed, expected, excluded
+):
+    """detailed (default True) decides whether size, modified time, and link are requested."""
+    await _LIST(
         service=mock_service,
         user_google_email="user@example.com",
         folder_id="root",
-        detailed=False,
+        **_detailed_kwargs(detailed),
     )
 
-    call_kwargs = mock_service.files.return_value.list.call_args.kwargs
-    assert "modifiedTime" not in call_kwargs["fields"]
-    assert "webViewLink" not in call_kwargs["fields"]
-    assert "size" not in call_kwargs["fields"]
+    fields = _field_names(list_call.kwargs["fields"])
+    assert expected <= fields
+    assert not excluded & fields
 
 
 # ---------------------------------------------------------------------------
@@ -584,17 +340,11 @@ async def test_list_detailed_false_requests_compact_api_fields(mock_resolve_fold
 # ---------------------------------------------------------------------------
 
 
-@pytest.mark.asyncio
-async def test_search_free_text_returns_results():
+async def test_search_free_text_returns_results(mock_service, list_call):
     """Free-text query is wrapped in fullText contains and results are formatted."""
-    mock_service = Mock()
-    mock_service.files().list().execute.return_value = {
-        "files": [
-            _make_file("f1", "My Doc", "application/vnd.google-apps.document"),
-        ]
-    }
+    list_call.response = _DOC_F1_LIST
 
-    result = await _unwrap(search_drive_files)(
+    result = await _SEARCH(
         service=mock_service,
         user_google_email="user@example.com",
         query="my doc",
@@ -605,13 +355,9 @@ async def test_search_free_text_returns_results():
     assert "f1" in result
 
 
-@pytest.mark.asyncio
-async def test_search_no_results():
+async def test_search_no_results(mock_service):
     """No results returns a clear message."""
-    mock_service = Mock()
-    mock_service.files().list().execute.return_value = {"files": []}
-
-    result = await _unwrap(search_drive_files)(
+    result = await _SEARCH(
         service=mock_service,
         user_google_email="user@example.com",
         query="nothing here",
@@ -620,20 +366,16 @@ async def test_search_no_results():
     assert "No files found" in result
 
 
-@pytest.mark.asyncio
-@patch("gdrive.drive_tools.resolve_folder_id", new_callable=AsyncMock)
-async def test_list_items_basic(mock_resolve_folder):
+async def test_list_items_basic(mock_service, list_call):
     """Basic listing without filters returns all items."""
-    mock_resolve_folder.return_value = "resolved_root"
-    mock_service = Mock()
-    mock_service.files().list().execute.return_value = {
+    list_call.response = {
         "files": [
-            _make_file("id1", "Folder A", "application/vnd.google-apps.folder"),
-            _make_file("id2", "Doc B", "application/vnd.google-apps.document"),
+            _make_file("id1", "Folder A", FOLDER_MIME_TYPE),
+            _make_file("id2", "Doc B", _DOC_MIME),
         ]
     }
 
-    result = await _unwrap(list_drive_items)(
+    result = await _LIST(
         service=mock_service,
         user_google_email="user@example.com",
         folder_id="root",
@@ -644,15 +386,9 @@ async def test_list_items_basic(mock_resolve_folder):
     assert "Doc B" in result
 
 
-@pytest.mark.asyncio
-@patch("gdrive.drive_tools.resolve_folder_id", new_callable=AsyncMock)
-async def test_list_items_no_results(mock_resolve_folder):
+async def test_list_items_no_results(mock_service):
     """Empty folder returns a clear message."""
-    mock_resolve_folder.return_value = "resolved_root"
-    mock_service = Mock()
-    mock_service.files().list().execute.return_value = {"files": []}
-
-    result = await _unwrap(list_drive_items)(
+    result = await _LIST(
         service=mock_service,
         user_google_email="user@example.com",
         folder_id="root",
@@ -666,144 +402,69 @@ async def test_list_items_no_results(mock_resolve_folder):
 # ---------------------------------------------------------------------------
 
 
-@pytest.mark.asyncio
-async def test_search_file_type_folder_adds_mime_filter():
-    """file_type='folder' appends the folder MIME type to the query."""
-    mock_service = Mock()
-    mock_service.files().list().execute.return_value = {
-        "files": [
-            _make_file("fold1", "My Folder", "application/vnd.google-apps.folder")
-        ]
-    }
-
-    result = await _unwrap(search_drive_files)(
-        service=mock_service,
-        user_google_email="user@example.com",
-        query="my",
-        file_type="folder",
-    )
-
-    assert "Found 1 files" in result
-    assert "My Folder" in result
-
-    call_kwargs = mock_service.files.return_value.list.call_args.kwargs
-    assert "mimeType = 'application/vnd.google-apps.folder'" in call_kwargs["q"]
-
-
-@pytest.mark.asyncio
-async def test_search_file_type_document_alias():
-    """Alias 'doc' resolves to the Google Docs MIME type."""
-    mock_service = Mock()
-    mock_service.files().list().execute.return_value = {"files": []}
-
-    await _unwrap(search_drive_files)(
-        service=mock_service,
-        user_google_email="user@example.com",
-        query="report",
-        file_type="doc",
-    )
-
-    call_kwargs = mock_service.files.return_value.list.call_args.kwargs
-    assert "mimeType = 'application/vnd.google-apps.document'" in call_kwargs["q"]
-
-
-@pytest.mark.asyncio
-async def test_search_file_type_plural_alias():
-    """Plural aliases are resolved for friendlier natural-language usage."""
-    mock_service = Mock()
-    mock_service.files().list().execute.return_value = {"files": []}
-
-    await _unwrap(search_drive_files)(
-        service=mock_service,
-        user_google_email="user@example.com",
-        query="project",
-        file_type="folders",
-    )
-
-    call_kwargs = mock_service.files.return_value.list.call_args.kwargs
-    assert "mimeType = 'application/vnd.google-apps.folder'" in call_kwargs["q"]
-
-
-@pytest.mark.asyncio
-async def test_search_file_type_sheet_alias():
-    """Alias 'sheet' resolves to the Google Sheets MIME type."""
-    mock_service = Mock()
-    mock_service.files().list().execute.return_value = {"files": []}
-
-    await _unwrap(search_drive_files)(
-        service=mock_service,
-        user_google_email="user@example.com",
-        query="budget",
-        file_type="sheet",
-    )
-
-    call_kwargs = mock_service.files.return_value.list.call_args.kwargs
-    assert "mimeType = 'application/vnd.google-apps.spreadsheet'" in call_kwargs["q"]
-
-
-@pytest.mark.asyncio
-async def test_search_file_type_raw_mime():
-    """A raw MIME type string is passed through unchanged."""
-    mock_service = Mock()
-    mock_service.files().list().execute.return_value = {
-        "files": [_make_file("p1", "Report.pdf", "application/pdf")]
-    }
+@pytest.mark.parametrize(
+    "file_type,expected_mime",
+    [
+        ("folder", FOLDER_MIME_TYPE),
+        ("folders", FOLDER_MIME_TYPE),
+        ("doc", _DOC_MIME),
+        ("sheet", _SHEET_MIME),
+        ("spreadsheet", _SHEET_MIME),
+        ("application/pdf", _PDF_MIME),
+    ],
+)
+async def test_search_file_type_mime_filter(
+    mock_service, list_call, file_type, expected_mime
+):
+    """Friendly aliases (including plurals) and raw MIME types append the MIME clause."""
+    list_call.response = {"files": [_make_file("m1", "Match", expected_mime)]}
 
-    result = await _unwrap(search_drive_files)(
+    result = await _SEARCH(
         service=mock_service,
         user_google_email="user@example.com",
         query="report",
-        file_type="application/pdf",
+        file_type=file_type,
     )
 
-    assert "Report.pdf" in result
-    call_kwargs = mock_service.files.return_value.list.call_args.kwargs
-    assert "mimeType = 'application/pdf'" in call_kwargs["q"]
+    assert "Found 1 files" in result
+    assert "Match" in result
+    call_kwargs = list_call.kwargs
+    assert f"mimeType = '{expected_mime}'" in call_kwargs["q"]
 
 
-@pytest.mark.asyncio
-async def test_search_file_type_none_no_mime_filter():
+async def test_search_file_type_none_no_mime_filter(mock_service, list_call):
     """When file_type is None no mimeType clause is added to the query."""
-    mock_service = Mock()
-    mock_service.files().list().execute.return_value = {"files": []}
-
-    await _unwrap(search_drive_files)(
+    await _SEARCH(
         service=mock_service,
         user_google_email="user@example.com",
         query="anything",
         file_type=None,
     )
 
-    call_kwargs = mock_service.files.return_value.list.call_args.kwargs
+    call_kwargs = list_call.kwargs
     assert "mimeType" not in call_kwargs["q"]
 
 
-@pytest.mark.asyncio
-async def test_search_file_type_structured_query_combined():
+async def test_search_file_type_structured_query_combined(mock_service, list_call):
     """file_type filter is appended even when the query is already structured."""
-    mock_service = Mock()
-    mock_service.files().list().execute.return_value = {"files": []}
-
-    await _unwrap(search_drive_files)(
+    await _SEARCH(
         service=mock_service,
         user_google_email="user@example.com",
         query="name contains 'budget'",
         file_type="spreadsheet",
     )
 
-    call_kwargs = mock_service.files.return_value.list.call_args.kwargs
+    call_kwargs = list_call.kwargs
     q = call_kwargs["q"]
     assert "name contains 'budget'" in q
     assert "mimeType = 'application/vnd.google-apps.spreadsheet'" in q
 
 
-@pytest.mark.asyncio
-async def test_search_file_type_unknown_raises_value_error():
+async def test_search_file_type_unknown_raises_value_error(mock_service):
     """An unrecognised friendly type name raises ValueError immediately."""
-    mock_service = Mock()
 
     with pytest.raises(ValueError, match="Unknown file_type"):
-        await _unwrap(search_drive_files)(
+        await _SEARCH(
             service=mock_service,
             user_google_email="user@example.com",
             query="something",
@@ -811,99 +472,57 @@ async def test_search_file_type_unknown_raises_value_error():
         )
 
 
-@pytest.mark.asyncio
-@patch("gdrive.drive_tools.resolve_folder_id", new_callable=AsyncMock)
-async def test_list_items_file_type_folder_adds_mime_filter(mock_resolve_folder):
-    """file_type='folder' appends the folder MIME clause to the query."""
-    mock_resolve_folder.return_value = "resolved_root"
-    mock_service = Mock()
-    mock_service.files().list().execute.return_value = {
-        "files": [_make_file("sub1", "SubFolder", "application/vnd.google-apps.folder")]
-    }
+@pytest.mark.parametrize(
+    "file_type,expected_mime",
+    [
+        ("folder", FOLDER_MIME_TYPE),
+        ("doc", _DOC_MIME),
+        ("sheet", _SHEET_MIME),
+        ("spreadsheet", _SHEET_MIME),
+        ("application/pdf", _PDF_MIME),
+    ],
+)
+async def test_list_items_file_type_mime_filter(
+    mock_service, list_call, file_type, expected_mime
+):
+    """Friendly aliases and raw MIME types append the MIME clause to the parents query."""
+    list_call.response = {"files": [_make_file("m1", "Match", expected_mime)]}
 
-    result = await _unwrap(list_drive_items)(
+    result = await _LIST(
         service=mock_service,
         user_google_email="user@example.com",
         folder_id="root",
-        file_type="folder",
+        file_type=file_type,
     )
 
     assert "Found 1 items" in result
-    assert "SubFolder" in result
+    assert "Match" in result
 
-    call_kwargs = mock_service.files.return_value.list.call_args.kwargs
+    call_kwargs = list_call.kwargs
     q = call_kwargs["q"]
     assert "'resolved_root' in parents" in q
     assert "trashed=false" in q
-    assert "mimeType = 'application/vnd.google-apps.folder'" in q
-
-
-@pytest.mark.asyncio
-@patch("gdrive.drive_tools.resolve_folder_id", new_callable=AsyncMock)
-async def test_list_items_file_type_spreadsheet(mock_resolve_folder):
-    """file_type='spreadsheet' appends the Sheets MIME clause."""
-    mock_resolve_folder.return_value = "folder_xyz"
-    mock_service = Mock()
-    mock_service.files().list().execute.return_value = {"files": []}
-
-    await _unwrap(list_drive_items)(
-        service=mock_service,
-        user_google_email="user@example.com",
-        folder_id="folder_xyz",
-        file_type="spreadsheet",
-    )
+    assert f"mimeType = '{expected_mime}'" in q
 
-    call_kwargs = mock_service.files.return_value.list.call_args.kwargs
-    assert "mimeType = 'application/vnd.google-apps.spreadsheet'" in call_kwargs["q"]
 
-
-@pytest.mark.asyncio
-@patch("gdrive.drive_tools.resolve_folder_id", new_callable=AsyncMock)
-async def test_list_items_file_type_raw_mime(mock_resolve_folder):
-    """A raw MIME type string is passed through unchanged."""
-    mock_resolve_folder.return_value = "folder_abc"
-    mock_service = Mock()
-    mock_service.files().list().execute.return_value = {"files": []}
-
-    await _unwrap(list_drive_items)(
-        service=mock_service,
-        user_google_email="user@example.com",
-        folder_id="folder_abc",
-        file_type="application/pdf",
-    )
-
-    call_kwargs = mock_service.files.return_value.list.call_args.kwargs
-    assert "mimeType = 'application/pdf'" in call_kwargs["q"]
-
-
-@pytest.mark.asyncio
-@patch("gdrive.drive_tools.resolve_folder_id", new_callable=AsyncMock)
-async def test_list_items_file_type_none_no_mime_filter(mock_resolve_folder):
+async def test_list_items_file_type_none_no_mime_filter(mock_service, list_call):
     """When file_type is None no mimeType clause is added."""
-    mock_resolve_folder.return_value = "resolved_root"
-    mock_service = Mock()
-    mock_service.files().list().execute.return_value = {"files": []}
-
-    await _unwrap(list_drive_items)(
+    await _LIST(
         service=mock_service,
         user_google_email="user@example.com",
         folder_id="root",
         file_type=None,
     )
 
-    call_kwargs = mock_service.files.return_value.list.call_args.kwargs
+    call_kwargs = list_call.kwargs
     assert "mimeType" not in call_kwargs["q"]
 
 
-@pytest.mark.asyncio
-@patch("gdrive.drive_tools.resolve_folder_id", new_callable=AsyncMock)
-async def test_list_items_file_type_unknown_raises(mock_resolve_folder):
+async def test_list_items_file_type_unknown_raises(mock_service):
     """An unrecognised friendly type name raises ValueError."""
-    mock_resolve_folder.return_value = "resolved_root"
-    mock_service = Mock()
 
     with pytest.raises(ValueError, match="Unknown file_type"):
-        await _unwrap(list_drive_items)(
+        await _LIST(
             service=mock_service,
             user_google_email="user@example.com",
             folder_id="root",
@@ -916,20 +535,16 @@ async def test_list_items_file_type_unknown_raises(mock_resolve_folder):
 # ---------------------------------------------------------------------------
 
 
-@pytest.mark.asyncio
-async def test_search_or_query_is_grouped_before_mime_filter():
+async def test_search_or_query_is_grouped_before_mime_filter(mock_service, list_call):
     """An OR structured query is wrapped in parentheses so MIME filter precedence is correct."""
-    mock_service = Mock()
-    mock_service.files().list().execute.return_value = {"files": []}
-
-    await _unwrap(search_drive_files)(
+    await _SEARCH(
         service=mock_service,
         user_google_email="user@example.com",
         query="name contains 'a' or name contains 'b'",
         file_type="document",
     )
 
-    q = mock_service.files.return_value.list.call_args.kwargs["q"]
+    q = list_call.kwargs["q"]
     assert q.startswith("(")
     assert "name contains 'a' or name contains 'b'" in q
     assert ") and mimeType = 'application/vnd.google-apps.document'" in q
@@ -942,29 +557,21 @@ async def test_search_or_query_is_grouped_before_mime_filter():
 
 def test_resolve_file_type_mime_invalid_mime_raises():
     """A raw string with '/' but containing quotes raises ValueError."""
-    from gdrive.drive_helpers import resolve_file_type_mime
-
     with pytest.raises(ValueError, match="Invalid MIME type"):
         resolve_file_type_mime("application/pdf' or '1'='1")
 
 
 def test_resolve_file_type_mime_strips_whitespace():
     """Leading/trailing whitespace is stripped from raw MIME strings."""
-    from gdrive.drive_helpers import resolve_file_type_mime
-
     assert resolve_file_type_mime("  application/pdf  ") == "application/pdf"
 
 
 def test_resolve_file_type_mime_normalizes_case():
     """Raw MIME types are normalized to lowercase for Drive query consistency."""
-    from gdrive.drive_helpers import resolve_file_type_mime
-
     assert resolve_file_type_mime("Application/PDF") == "application/pdf"
 
 
 def test_resolve_file_type_mime_empty_raises():
     """Blank values are rejected with a clear validation error."""
-    from gdrive.drive_helpers import resolve_file_type_mime
-
     with pytest.raises(ValueError, match="cannot be empty"):
         resolve_file_type_mime("   ")
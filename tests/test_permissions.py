@@ -31,6 +31,12 @@ from auth.scopes import (
     DRIVE_FILE_SCOPE,
 )
 
+_SERVICE_LEVELS = [
+    (service, level_name)
+    for service, levels in SERVICE_PERMISSION_LEVELS.items()
+    for level_name, _ in levels
+]
+
 
 class TestParsePermissionsArg:
     """Tests for parse_permissions_arg()."""
@@ -119,12 +125,11 @@ class TestGetScopesForPermission:
 
     def test_no_duplicate_scopes(self):
         """Cumulative expansion should deduplicate scopes."""
-        for service, levels in SERVICE_PERMISSION_LEVELS.items():
-            for level_name, _ in levels:
-                scopes = get_scopes_for_permission(service, level_name)
-                assert len(scopes) == len(set(scopes)), (
-                    f"Duplicate scopes for {service}:{level_name}"
-                )
+        for service, level_name in _SERVICE_LEVELS:
+            scopes = get_scopes_for_permission(service, level_name)
+            assert len(scopes) == len(set(scopes)), (
+                f"Duplicate scopes for {service}:{level_name}"
+            )
 
     def test_tasks_manage_includes_write_scope(self):
         """Manage level should cumulatively include readonly and write scopes."""
@@ -9,6 +9,8 @@ export_doc_to_pdf, and list_spreadsheets — without requiring --tools drive.
 import sys
 import os
 
+import pytest
+
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
 
 from auth.scopes import (
@@ -34,6 +36,14 @@ from auth.scopes import (
 )
 from auth.permissions import get_scopes_for_permission, set_permissions
 import auth.permissions as permissions_module
+import auth.scopes as scopes_module
+
+
+@pytest.fixture
+def reset_scope_globals(monkeypatch):
+    """Start from full (non-read-only) mode with no granular permissions."""
+    monkeypatch.setattr(scopes_module, "_READ_ONLY_MODE", False)
+    monkeypatch.setattr(permissions_module, "_PERMISSIONS", None)
 
 
 class TestDocsScopes:
@@ -83,15 +93,10 @@ class TestCombinedScopes:
         assert len(scopes) == len(set(scopes))
 
 
+@pytest.mark.usefixtures("reset_scope_globals")
 class TestReadOnlyScopes:
     """Tests for read-only mode scope generation."""
 
-    def setup_method(self):
-        set_read_only(False)
-
-    def teardown_method(self):
-        set_read_only(False)
-
     def test_docs_readonly_includes_drive_readonly(self):
         """Even in read-only mode, docs needs drive.readonly for search/list."""
         set_read_only(True)
@@ -111,6 +116,55 @@ class TestReadOnlyScopes:
         assert DRIVE_READONLY_SCOPE in scopes
 
 
+# (available, required, expected) single-scope hierarchy checks.
+_HIERARCHY_CASES = [
+    # Gmail hierarchy: gmail.modify covers readonly, send, compose, labels
+    pytest.param(
+        GMAIL_MODIFY_SCOPE,
+        GMAIL_READONLY_SCOPE,
+        True,
+        id="gmail_modify_covers_readonly",
+    ),
+    pytest.param(
+        GMAIL_MODIFY_SCOPE, GMAIL_SEND_SCOPE, True, id="gmail_modify_covers_send"
+    ),
+    pytest.param(
+        GMAIL_MODIFY_SCOPE, GMAIL_COMPOSE_SCOPE, True, id="gmail_modify_covers_compose"
+    ),
+    pytest.param(
+        GMAIL_MODIFY_SCOPE, GMAIL_LABELS_SCOPE, True, id="gmail_modify_covers_labels"
+    ),
+    pytest.param(
+        GMAIL_MODIFY_SCOPE,
+        GMAIL_SETTINGS_BASIC_SCOPE,
+        False,
+        id="gmail_modify_does_not_cover_settings",
+    ),
+    # Drive hierarchy: drive covers drive.readonly and drive.file
+    pytest.param(DRIVE_SCOPE, DRIVE_READONLY_SCOPE, True, id="drive_covers_readonly"),
+    pytest.param(DRIVE_SCOPE, DRIVE_FILE_SCOPE, True, id="drive_covers_file"),
+    pytest.param(
+        DRIVE_READONLY_SCOPE,
+        DRIVE_SCOPE,
+        False,
+        id="drive_readonly_does_not_cover_full",
+    ),
+    # Other hierarchies
+    pytest.param(
+        CALENDAR_SCOPE, CALENDAR_READONLY_SCOPE, True, id="calendar_covers_readonly"
+    ),
+    pytest.param(
+        SHEETS_WRITE_SCOPE,
+        SHEETS_READONLY_SCOPE,
+        True,
+        id="sheets_write_covers_readonly",
+    ),
+    pytest.param(
+        CONTACTS_SCOPE, CONTACTS_READONLY_SCOPE, True, id="contacts_covers_readonly"
+    ),
+]
+
+
 class TestHasRequiredScopes:
     """Tests for hierarchy-aware scope checking."""
 
@@ -139,24 +193,10 @@ class TestHasRequiredScopes:
         """None available with no required scopes should pass."""
         assert has_required_scopes(None, [])
 
-    # Gmail hierarchy: gmail.modify covers readonly, send, compose, labels
-    def test_gmail_modify_covers_readonly(self):
-        assert has_required_scopes([GMAIL_MODIFY_SCOPE], [GMAIL_READONLY_SCOPE])
-
-    def test_gmail_modify_covers_send(self):
-        assert has_required_scopes([GMAIL_MODIFY_SCOPE], [GMAIL_SEND_SCOPE])
-
-    def test_gmail_modify_covers_compose(self):
-        assert has_required_scopes([GMAIL_MODIFY_SCOPE], [GMAIL_COMPOSE_SCOPE])
-
-    def test_gmail_modify_covers_labels(self):
-        assert has_required_scopes([GMAIL_MODIFY_SCOPE], [GMAIL_LABELS_SCOPE])
-
-    def test_gmail_modify_does_not_cover_settings(self):
-        """gmail.modify does NOT cover gmail.settings.basic."""
-        assert not has_required_scopes(
-            [GMAIL_MODIFY_SCOPE], [GMAIL_SETTINGS_BASIC_SCOPE]
-        )
+    @pytest.mark.parametrize("available,required,expected", _HIERARCHY_CASES)
+    def test_scope_hierarchy(self, available, required, expected):
+        """A broader scope satisfies its children, never the other way round."""
+        assert has_required_scopes([available], [required]) is expected
 
     def test_gmail_modify_covers_multiple_children(self):
         """gmail.modify should satisfy multiple child scopes at once."""
@@ -165,27 +205,6 @@ class TestHasRequiredScopes:
             [GMAIL_READONLY_SCOPE, GMAIL_SEND_SCOPE, GMAIL_LABELS_SCOPE],
         )
 
-    # Drive hierarchy: drive covers drive.readonly and drive.file
-    def test_drive_covers_readonly(self):
-        assert has_required_scopes([DRIVE_SCOPE], [DRIVE_READONLY_SCOPE])
-
-    def test_drive_covers_file(self):
-        assert has_required_scopes([DRIVE_SCOPE], [DRIVE_FILE_SCOPE])
-
-    def test_drive_readonly_does_not_cover_full(self):
-        """Narrower scope should not satisfy broader scope."""
-        assert not has_required_scopes([DRIVE_READONLY_SCOPE], [DRIVE_SCOPE])
-
-    # Other hierarchies
-    def test_calendar_covers_readonly(self):
-        assert has_required_scopes([CALENDAR_SCOPE], [CALENDAR_READONLY_SCOPE])
-
-    def test_sheets_write_covers_readonly(self):
-        assert has_required_scopes([SHEETS_WRITE_SCOPE], [SHEETS_READONLY_SCOPE])
-
-    def test_contacts_covers_readonly(self):
-        assert has_required_scopes([CONTACTS_SCOPE], [CONTACTS_READONLY_SCOPE])
-
     # Mixed: some exact, some via hierarchy
     def test_mixed_exact_and_hierarchy(self):
         """Combination of exact matches and hierarchy-implied scopes."""
@@ -200,17 +219,10 @@ class TestHasRequiredScopes:
         assert not has_required_scopes(available, required)
 
 
+@pytest.mark.usefixtures("reset_scope_globals")
 class TestGranularPermissionsScopes:
     """Tests for granular permissions scope generation path."""
 
-    def setup_method(self):
-        set_read_only(False)
-        permissions_module._PERMISSIONS = None
-
-    def teardown_method(self):
-        set_read_only(False)
-        permissions_module._PERMISSIONS = None
-
     def test_permissions_mode_returns_base_plus_permission_scopes(self):
         set_permissions({"gmail": "send", "drive": "readonly"})
         scopes = get_scopes_for_tools(["calendar"])  # ignored in permissions mode